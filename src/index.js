@@ -1,5 +1,17 @@
-require('dotenv').config();
-const fastify = require('fastify')({ logger: process.env.LOG_LEVEL || false });
+const { loadConfig } = require('./services/config');
+const { ExchangeManager } = require('./services/exchangeManager');
+const { createPaperAdapter } = require('./services/adapters/paper');
+
+const config = loadConfig();
+const fastify = require('fastify')({ logger: config.logLevel || false });
+
+const { TradingEngine } = require('./services/engine');
+const { STRATEGY_REGISTRY, createStrategy } = require('./services/strategies');
+const { warmupIndicators } = require('./services/indicators');
+
+const exchangeManager = new ExchangeManager(config.engine);
+exchangeManager.connect('paper', createPaperAdapter());
+const engine = new TradingEngine({ exchangeManager, config: config.engine });
 
 const service = {
   name: 'QuantOps Engine',
@@ -8,11 +20,26 @@ const service = {
   owners: ['backend', 'platform', 'security'],
 };
 
+// Liveness endpoints get polled hard by orchestrators; allocating and
+// formatting a Date per request is avoidable. The ISO string is cached and
+// refreshed at ~0.5s resolution, which is plenty for a heartbeat.
+let cachedIsoTime = '';
+let cachedIsoAt = 0;
+
+function nowIso() {
+  const now = Date.now();
+  if (now - cachedIsoAt > 500) {
+    cachedIsoTime = new Date(now).toISOString();
+    cachedIsoAt = now;
+  }
+  return cachedIsoTime;
+}
+
 function health() {
   return {
     service: service.name,
     status: 'ok',
-    timestamp: new Date().toISOString(),
+    timestamp: nowIso(),
   };
 }
 
@@ -30,8 +57,69 @@ function planWorkflow(input) {
   };
 }
 
-fastify.get('/health', async () => health());
-fastify.post('/plan', async (request) => planWorkflow(request.body || {}));
+// Response schemas let fastify serialize through its compiled
+// fast-json-stringify path instead of generic JSON.stringify — the main win
+// on hot polling endpoints.
+const healthSchema = {
+  response: {
+    200: {
+      type: 'object',
+      properties: {
+        service: { type: 'string' },
+        status: { type: 'string' },
+        timestamp: { type: 'string' },
+      },
+    },
+  },
+};
+
+const planSchema = {
+  response: {
+    200: {
+      type: 'object',
+      properties: {
+        id: { type: 'string' },
+        steps: { type: 'array', items: { type: 'string' } },
+        notes: { type: 'string' },
+      },
+    },
+  },
+};
+
+// Handlers that never await are plain sync functions: no coroutine/promise
+// wrapper per request, fastify just serializes the returned value.
+fastify.get('/health', { schema: healthSchema }, () => health());
+fastify.post('/plan', { schema: planSchema }, (request) => planWorkflow(request.body || {}));
+
+fastify.get('/status', () => engine.getStatus());
+
+fastify.get('/strategies', () => ({
+  available: Object.keys(STRATEGY_REGISTRY),
+  active: engine.strategies.map((s) => s.constructor.name),
+}));
+
+fastify.post('/strategies', (request, reply) => {
+  const { type, config: strategyConfig } = request.body || {};
+  const strategy = createStrategy(type, strategyConfig);
+  if (!strategy) {
+    reply.code(400);
+    return { error: `unknown strategy type: ${type}` };
+  }
+  engine.addStrategy(strategy);
+  return { added: type, active: engine.strategies.length };
+});
+
+// Symbols use '-' in the path (BTC-USDT -> BTC/USDT). Ticker and order book
+// are fetched concurrently, and the book is requested at depth 10 so the
+// venue never sends more levels than the endpoint returns.
+fastify.get('/market/:symbol', async (request) => {
+  const symbol = request.params.symbol.replace('-', '/');
+  const [ticker, orderbook] = await Promise.all([
+    exchangeManager.fetchTicker(symbol),
+    exchangeManager.fetchOrderBook(symbol, { limit: 10 }),
+  ]);
+  return { symbol, ticker, orderbook };
+});
 
 if (require.main === module) {
   if (process.argv.includes('--self-test')) {
@@ -39,7 +127,9 @@ if (require.main === module) {
     console.log('[plan]', planWorkflow({ useCase: 'sandbox' }));
     process.exit(0);
   }
-  const port = process.env.PORT || 3000;
+  // Tier the indicator kernels up before the first live tick hits them.
+  warmupIndicators();
+  const port = config.port;
   fastify.listen({ port, host: '0.0.0.0' }).then(() => {
     console.log(`Service ${service.name} listening on ${port}`);
   }).catch((err) => {
@@ -0,0 +1,115 @@
+const { generateSampleData, mulberry32 } = require('../sampleData');
+
+// Deterministic in-process venue backed by the sample-data generator, so the
+// service (and its self-test) runs without external connectivity. Real
+// venues implement the same fetchTicker/fetchOrderBook/fetchOHLCV surface.
+
+function symbolSeed(symbol) {
+  let hash = 0;
+  for (let i = 0; i < symbol.length; i += 1) {
+    hash = (hash * 31 + symbol.charCodeAt(i)) | 0;
+  }
+  return hash >>> 0;
+}
+
+function createPaperAdapter({ seed = 42, days = 30 } = {}) {
+  const seriesBySymbol = new Map();
+
+  const seriesFor = (symbol) => {
+    let series = seriesBySymbol.get(symbol);
+    if (!series) {
+      series = generateSampleData({
+        days,
+        seed: seed + symbolSeed(symbol),
+        startTime: Date.now() - days * 24 * 3600000,
+      });
+      seriesBySymbol.set(symbol, series);
+    }
+    return series;
+  };
+
+  return {
+    name: 'paper',
+
+    async fetchTicker(symbol) {
+      const series = seriesFor(symbol);
+      const i = series.length - 1;
+      return {
+        symbol,
+        last: series.close[i],
+        high: series.high[i],
+        low: series.low[i],
+        volume: series.volume[i],
+        timestamp: series.timestamp[i],
+      };
+    },
+
+    async fetchTickers(symbols) {
+      const tickers = {};
+      for (const symbol of symbols) {
+        tickers[symbol] = await this.fetchTicker(symbol);
+      }
+      return tickers;
+    },
+
+    // Depth is honoured at the venue: only `limit` levels per side are built.
+    async fetchOrderBook(symbol, limit = 10) {
+      const series = seriesFor(symbol);
+      const last = series.close[series.length - 1];
+      const bids = new Array(limit);
+      const asks = new Array(limit);
+      for (let level = 0; level < limit; level += 1) {
+        const offset = (level + 1) * 0.0005;
+        bids[level] = [last * (1 - offset), 1 + level * 0.5];
+        asks[level] = [last * (1 + offset), 1 + level * 0.5];
+      }
+      return { symbol, bids, asks, timestamp: series.timestamp[series.length - 1] };
+    },
+
+    // Synthetic push stream: emits a jittered tick periodically, standing in
+    // for a websocket feed. Returns an unsubscribe function.
+    watchTicker(symbol, handler, intervalMs = 500) {
+      const series = seriesFor(symbol);
+      const i = series.length - 1;
+      let last = series.close[i];
+      const rand = mulberry32(symbolSeed(symbol) ^ 0x9e3779b9);
+      const timer = setInterval(() => {
+        last *= 1 + (rand() * 2 - 1) * 0.0005;
+        handler({
+          symbol,
+          last,
+          high: series.high[i],
+          low: series.low[i],
+          volume: series.volume[i],
+          timestamp: Date.now(),
+        });
+      }, intervalMs);
+      timer.unref();
+      return () => clearInterval(timer);
+    },
+
+    async fetchOHLCV(symbol, { limit = 100, since } = {}) {
+      const series = seriesFor(symbol);
+      let start = Math.max(series.length - limit, 0);
+      if (since !== undefined) {
+        while (start < series.length && series.timestamp[start] < since) {
+          start += 1;
+        }
+      }
+      const rows = [];
+      for (let i = start; i < series.length; i += 1) {
+        rows.push([
+          series.timestamp[i],
+          series.open[i],
+          series.high[i],
+          series.low[i],
+          series.close[i],
+          series.volume[i],
+        ]);
+      }
+      return rows;
+    },
+  };
+}
+
+module.exports = { createPaperAdapter };
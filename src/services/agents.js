@@ -0,0 +1,334 @@
+const { mulberry32 } = require('./sampleData');
+
+// Evaluation agents: each agent scores a proposed signal in [0, 1] from a
+// small feature vector through its own randomly-initialized MLP, and the
+// swarm combines agent scores into a weighted consensus. Models are seeded
+// per agent so runs are reproducible.
+
+const DEFAULT_LAYERS = [16, 8];
+
+// Tail statistics over the typed OHLCV columns shared with the strategies,
+// pulled out of the Agent class so the JIT compiles one standalone numeric
+// loop shared by every agent. Results are written into a caller-owned struct
+// to keep the kernel allocation-free.
+function ohlcvTailStats(columns, end, window, stats) {
+  const { close, volume } = columns;
+  const start = end > window ? end - window : 0;
+  const count = end - start;
+  let sum = 0;
+  let sumSq = 0;
+  let max = -Infinity;
+  let min = Infinity;
+  let volSum = 0;
+  for (let i = start; i < end; i += 1) {
+    const c = close[i];
+    sum += c;
+    sumSq += c * c;
+    if (c > max) {
+      max = c;
+    }
+    if (c < min) {
+      min = c;
+    }
+    volSum += volume[i];
+  }
+  const mean = sum / count;
+  stats.mean = mean;
+  stats.std = Math.sqrt(Math.max(sumSq / count - mean * mean, 0));
+  stats.max = max;
+  stats.min = min;
+  stats.meanVolume = volSum / count;
+  stats.lastVolume = volume[end - 1];
+}
+
+// Layers are stored as contiguous row-major Float32Array weight blocks plus
+// bias vectors — no nested per-neuron arrays. The forward pass below walks
+// the flat blocks directly, which is the lean-runtime analog of exporting
+// the model out of a generic layer-graph framework.
+function buildMlp(inputDim, hiddenLayers, seed) {
+  const rand = mulberry32(seed);
+  const layers = [];
+  let prev = inputDim;
+  for (const size of [...hiddenLayers, 1]) {
+    const weights = new Float32Array(size * prev);
+    const scale = 1 / Math.sqrt(prev);
+    for (let k = 0; k < weights.length; k += 1) {
+      weights[k] = (rand() * 2 - 1) * scale;
+    }
+    layers.push({ inSize: prev, outSize: size, weights, biases: new Float32Array(size) });
+    prev = size;
+  }
+  return layers;
+}
+
+// Post-training dynamic quantization: weights drop to int8 with one scale
+// per layer (symmetric, scale = max|w| / 127). Quarter the weight bytes;
+// scores shift by well under the consensus threshold granularity for these
+// small MLPs. Enabled per agent via config.quantize.
+function quantizeModel(layers) {
+  return layers.map((layer) => {
+    let maxAbs = 0;
+    for (let k = 0; k < layer.weights.length; k += 1) {
+      const a = Math.abs(layer.weights[k]);
+      if (a > maxAbs) {
+        maxAbs = a;
+      }
+    }
+    const scale = maxAbs > 0 ? maxAbs / 127 : 1;
+    const qweights = new Int8Array(layer.weights.length);
+    for (let k = 0; k < layer.weights.length; k += 1) {
+      qweights[k] = Math.round(layer.weights[k] / scale);
+    }
+    return { inSize: layer.inSize, outSize: layer.outSize, qweights, scale, biases: layer.biases };
+  });
+}
+
+class Agent {
+  constructor(config = {}) {
+    this.config = config;
+    this.name = config.name || 'agent';
+    this.weight = config.weight || 1;
+    this.inputDim = config.inputDim || 8;
+    this.model = buildMlp(this.inputDim, config.hiddenLayers || DEFAULT_LAYERS, config.seed || 1);
+    if (config.quantize) {
+      this.model = quantizeModel(this.model);
+    }
+    this._tailStats = { mean: 0, std: 0, max: 0, min: 0, meanVolume: 0, lastVolume: 0 };
+    // Two ping-pong activation buffers sized for the widest layer, allocated
+    // once per agent: the forward pass reads one while writing the other, so
+    // inference makes zero allocations per call.
+    let maxOut = 1;
+    for (const layer of this.model) {
+      if (layer.outSize > maxOut) {
+        maxOut = layer.outSize;
+      }
+    }
+    this._actA = new Float64Array(maxOut);
+    this._actB = new Float64Array(maxOut);
+    // Batch score output, grown on demand and reused across cycles.
+    this._scores = new Float64Array(0);
+  }
+
+  async evaluateSignal(signal, marketData) {
+    const features = this._extractFeatures(signal, marketData);
+    return this._forward(features);
+  }
+
+  // Scores a whole batch of prepared feature vectors in one call, so the
+  // per-call overhead (dispatch, bookkeeping) is paid once per agent per
+  // cycle instead of once per (agent, signal). The returned buffer is owned
+  // by the agent and overwritten on the next call; only the first
+  // featureRows.length entries are meaningful.
+  scoreBatch(featureRows) {
+    if (this._scores.length < featureRows.length) {
+      this._scores = new Float64Array(featureRows.length);
+    }
+    const scores = this._scores;
+    for (let i = 0; i < featureRows.length; i += 1) {
+      scores[i] = this._forward(featureRows[i]);
+    }
+    return scores;
+  }
+
+  // Features land in a zero-initialized Float64Array of exactly inputDim and
+  // are filled by index: missing data keeps its zeros, so there is no pad
+  // loop and no trailing slice. Callers may pass a reusable output buffer;
+  // it is re-zeroed here.
+  _extractFeatures(signal, marketData, outBuf) {
+    let out = outBuf;
+    if (out === undefined) {
+      out = new Float64Array(this.inputDim);
+    } else {
+      out.fill(0);
+    }
+    out[0] = signal.action === 'buy' ? 1 : -1;
+    const data = marketData[signal.symbol];
+    if (data && data.ticker) {
+      const last = data.ticker.last || 0;
+      const columns = data.columns;
+      if (last > 0 && columns && columns.length > 0 && this.inputDim >= 8) {
+        const stats = this._tailStats;
+        ohlcvTailStats(columns, columns.length, 20, stats);
+        out[1] = stats.mean / last - 1;
+        out[2] = stats.std / last;
+        out[3] = stats.max / last - 1;
+        out[4] = stats.min / last - 1;
+        out[5] = stats.meanVolume > 0 ? stats.lastVolume / stats.meanVolume - 1 : 0;
+        out[6] = (data.ticker.high || last) / last - 1;
+        out[7] = (data.ticker.low || last) / last - 1;
+      }
+    }
+    return out;
+  }
+
+  _forward(features) {
+    let activations = features;
+    let next = this._actA;
+    for (let l = 0; l < this.model.length; l += 1) {
+      const layer = this.model[l];
+      const { inSize, outSize, biases } = layer;
+      const lastLayer = l === this.model.length - 1;
+      if (layer.qweights !== undefined) {
+        const { qweights, scale } = layer;
+        for (let i = 0; i < outSize; i += 1) {
+          let sum = 0;
+          const base = i * inSize;
+          for (let j = 0; j < inSize; j += 1) {
+            sum += qweights[base + j] * activations[j];
+          }
+          sum = biases[i] + sum * scale;
+          next[i] = lastLayer ? sum : Math.max(sum, 0);
+        }
+      } else {
+        const weights = layer.weights;
+        for (let i = 0; i < outSize; i += 1) {
+          let sum = biases[i];
+          const base = i * inSize;
+          for (let j = 0; j < inSize; j += 1) {
+            sum += weights[base + j] * activations[j];
+          }
+          next[i] = lastLayer ? sum : Math.max(sum, 0);
+        }
+      }
+      activations = next;
+      next = next === this._actA ? this._actB : this._actA;
+    }
+    return 1 / (1 + Math.exp(-activations[0]));
+  }
+}
+
+class AgentSwarm {
+  constructor(config = {}) {
+    this.agents = [];
+    this.consensusThreshold = config.consensusThreshold || 0.55;
+    // Per-cycle scratch, grown on demand and reused across processSignals
+    // calls. The engine awaits each cycle before starting the next, so the
+    // buffers are never live in two calls at once. Feature vectors come from
+    // a pool with one distinct buffer per signal slot — they must not alias,
+    // since every agent reads the whole batch.
+    this._weighted = new Float64Array(0);
+    this._decided = new Int8Array(0);
+    this._featurePool = [];
+    this._recomputeWeights();
+  }
+
+  addAgent(agent) {
+    this.agents.push(agent);
+    this._recomputeWeights();
+  }
+
+  // Membership changes are rare; the weight vector, its sum and the
+  // weight-descending evaluation order are derived here once instead of
+  // being rebuilt on every processSignals call. Heaviest agents go first so
+  // consensus outcomes lock in with as few evaluations as possible.
+  _recomputeWeights() {
+    const n = this.agents.length;
+    this._weights = new Float64Array(n);
+    this._weightSum = 0;
+    for (let i = 0; i < n; i += 1) {
+      this._weights[i] = this.agents[i].weight;
+      this._weightSum += this._weights[i];
+    }
+    const order = Array.from({ length: n }, (_, i) => i);
+    order.sort((a, b) => this._weights[b] - this._weights[a]);
+    this._order = order;
+  }
+
+  // Batched consensus: feature vectors are extracted once per signal (they
+  // do not depend on the agent), then each agent scores the whole signal
+  // batch in a single scoreBatch call. Inference cost per cycle becomes
+  // agents + signals instead of agents x signals extractions, and consensus
+  // reduces the per-agent score vectors with indexed dot-product loops.
+  async processSignals(signals, marketData) {
+    const approved = [];
+    const agentCount = this.agents.length;
+    const signalCount = signals.length;
+    if (agentCount === 0 || signalCount === 0) {
+      return approved;
+    }
+    const extractor = this.agents[0];
+    const pool = this._featurePool;
+    while (pool.length < signalCount) {
+      pool.push(new Float64Array(extractor.inputDim));
+    }
+    const featureRows = new Array(signalCount);
+    for (let s = 0; s < signalCount; s += 1) {
+      const buf = pool[s].length === extractor.inputDim ? pool[s] : new Float64Array(extractor.inputDim);
+      pool[s] = buf;
+      featureRows[s] = extractor._extractFeatures(signals[s], marketData, buf);
+    }
+    const weights = this._weights;
+    const weightSum = this._weightSum;
+    if (this._weighted.length < signalCount) {
+      this._weighted = new Float64Array(signalCount);
+      this._decided = new Int8Array(signalCount);
+    }
+    const weighted = this._weighted.fill(0, 0, signalCount);
+    // In-process agents score synchronously via scoreBatch; agents backed by
+    // external inference (async evaluateSignal only) are fanned out with one
+    // Promise.all across every (agent, signal) pair, so the cycle waits for
+    // the slowest call instead of the sum of all of them.
+    const pending = [];
+    // Agents run heaviest-first with a running bound: scores live in [0, 1],
+    // so once weighted[s] clears the threshold (approve locked in) or cannot
+    // reach it even if every remaining agent scored 1.0 (reject locked in),
+    // the signal is decided. When every signal is decided the rest of the
+    // swarm is skipped outright. The bound is only applied while no async
+    // agent contributions are outstanding, since those would invalidate it.
+    const order = this._order;
+    const thresholdWeight = this.consensusThreshold * weightSum;
+    const decided = this._decided.fill(0, 0, signalCount);
+    let undecided = signalCount;
+    let remaining = weightSum;
+    for (let k = 0; k < agentCount; k += 1) {
+      const i = order[k];
+      const agent = this.agents[i];
+      const w = weights[i];
+      if (typeof agent.scoreBatch === 'function') {
+        const scores = agent.scoreBatch(featureRows);
+        for (let s = 0; s < signalCount; s += 1) {
+          weighted[s] += scores[s] * w;
+        }
+      } else {
+        for (let s = 0; s < signalCount; s += 1) {
+          const slot = s;
+          pending.push(agent.evaluateSignal(signals[s], marketData).then((score) => {
+            weighted[slot] += score * w;
+          }));
+        }
+      }
+      remaining -= w;
+      if (pending.length === 0) {
+        for (let s = 0; s < signalCount; s += 1) {
+          if (decided[s] === 0) {
+            if (weighted[s] >= thresholdWeight) {
+              decided[s] = 1;
+              undecided -= 1;
+            } else if (weighted[s] + remaining < thresholdWeight) {
+              decided[s] = -1;
+              undecided -= 1;
+            }
+          }
+        }
+        if (undecided === 0) {
+          break;
+        }
+      }
+    }
+    if (pending.length > 0) {
+      await Promise.all(pending);
+    }
+    for (let s = 0; s < signalCount; s += 1) {
+      const consensus = weightSum > 0 ? weighted[s] / weightSum : 0;
+      if (consensus >= this.consensusThreshold) {
+        const signal = signals[s];
+        approved.push(typeof signal.withConsensus === 'function'
+          ? signal.withConsensus(consensus)
+          : { ...signal, consensusScore: consensus });
+      }
+    }
+    return approved;
+  }
+}
+
+module.exports = { Agent, AgentSwarm };
@@ -0,0 +1,349 @@
+const OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume'];
+
+// Columnar input (e.g. straight from generateSampleData or a feed that
+// already stores typed columns) is used as-is; only row-object arrays pay
+// the conversion.
+function isColumnar(data) {
+  return data !== null && typeof data === 'object' && !Array.isArray(data)
+    && ArrayBuffer.isView(data.close) && typeof data.length === 'number';
+}
+
+function asColumns(data) {
+  return isColumnar(data) ? data : toColumns(data);
+}
+
+function toColumns(rows) {
+  const n = rows.length;
+  const cols = {
+    length: n,
+    timestamp: new Float64Array(n),
+    open: new Float64Array(n),
+    high: new Float64Array(n),
+    low: new Float64Array(n),
+    close: new Float64Array(n),
+    volume: new Float64Array(n),
+  };
+  for (let i = 0; i < n; i += 1) {
+    const row = rows[i];
+    cols.timestamp[i] = row.timestamp;
+    cols.open[i] = row.open;
+    cols.high[i] = row.high;
+    cols.low[i] = row.low;
+    cols.close[i] = row.close;
+    cols.volume[i] = row.volume;
+  }
+  return cols;
+}
+
+// First own key without materializing the whole key array.
+function firstKey(obj) {
+  for (const key in obj) {
+    if (Object.prototype.hasOwnProperty.call(obj, key)) {
+      return key;
+    }
+  }
+  return undefined;
+}
+
+// Numeric fill core shared by both run paths. action is +1 (buy) or -1
+// (sell); cash/position are carried in a caller-owned state struct so the
+// function itself is branchy float math with no allocation. Returns the
+// executed price, or 0 when the fill is rejected.
+function applyFill(state, action, price, amount, commission, slippage) {
+  const execPrice = price * (1 + slippage * action);
+  if (action > 0) {
+    const cost = execPrice * amount * (1 + commission);
+    if (cost > state.cash) {
+      return 0;
+    }
+    state.cash -= cost;
+    state.position += amount;
+  } else {
+    if (amount > state.position) {
+      return 0;
+    }
+    state.cash += execPrice * amount * (1 - commission);
+    state.position -= amount;
+  }
+  return execPrice;
+}
+
+// Single fused pass over the equity buffer: bar returns, their first two
+// moments and the running drawdown are accumulated together so the array is
+// walked once instead of once per statistic. Kept as a standalone function
+// over a Float64Array so the JIT sees one monomorphic numeric loop.
+const BARS_PER_YEAR = 365 * 24;
+const SQRT_BARS_PER_YEAR = Math.sqrt(BARS_PER_YEAR);
+
+function metricsKernel(equity) {
+  const n = equity.length;
+  let sum = 0;
+  let sumSq = 0;
+  let peak = equity[0];
+  let maxDrawdown = 0;
+  // Log-returns: the running log is carried between iterations so each bar
+  // costs one Math.log instead of a divide plus a fresh log pair, and the
+  // moments annualize with the constants hoisted above.
+  let logPrev = Math.log(equity[0]);
+  for (let i = 1; i < n; i += 1) {
+    const value = equity[i];
+    const logValue = Math.log(value);
+    const r = logValue - logPrev;
+    logPrev = logValue;
+    sum += r;
+    sumSq += r * r;
+    if (value > peak) {
+      peak = value;
+    }
+    const drawdown = (peak - value) / peak;
+    if (drawdown > maxDrawdown) {
+      maxDrawdown = drawdown;
+    }
+  }
+  const count = n - 1;
+  const mean = sum / count;
+  const variance = Math.max(sumSq / count - mean * mean, 0);
+  const volatility = Math.sqrt(variance) * SQRT_BARS_PER_YEAR;
+  return {
+    totalReturn: equity[n - 1] / equity[0] - 1,
+    volatility,
+    sharpeRatio: volatility > 0 ? (mean * BARS_PER_YEAR) / volatility : 0,
+    maxDrawdown,
+  };
+}
+
+class Backtester {
+  constructor(config = {}) {
+    this.initialCapital = config.initialCapital || 10000;
+    this.commission = config.commission || 0.001;
+    this.slippage = config.slippage || 0.0005;
+    this._fillState = { cash: 0, position: 0 };
+    this.reset();
+  }
+
+  reset() {
+    this.capital = this.initialCapital;
+    this.positions = {};
+    this.equityCurve = new Float64Array(0);
+    this.timestamps = new Float64Array(0);
+    // Trade tape as parallel typed buffers plus a symbol table; row objects
+    // are only materialized if a caller actually reads the trades.
+    this._tradeCount = 0;
+    this._tradeActions = new Int8Array(256);
+    this._tradeSymbolIds = new Int32Array(256);
+    this._tradeAmounts = new Float64Array(256);
+    this._tradePrices = new Float64Array(256);
+    this._tradeTimestamps = new Float64Array(256);
+    this._symbolTable = [];
+    this._symbolIds = new Map();
+  }
+
+  async run(strategy, historicalData) {
+    this.reset();
+    const primarySymbol = firstKey(historicalData);
+    if (primarySymbol === undefined) {
+      return this._calculateMetrics();
+    }
+    const columns = asColumns(historicalData[primarySymbol]);
+
+    if (typeof strategy.generateSignalsBatch === 'function') {
+      return this._runBatch(strategy, primarySymbol, columns);
+    }
+    return this._runPerBar(strategy, primarySymbol, historicalData, columns);
+  }
+
+  // Batch path: the strategy evaluates the whole series at once and returns
+  // aligned arrays (actions: +1 buy / -1 sell / 0 hold, amounts in base units).
+  // Fills are then simulated in a single pass over the typed arrays, so the
+  // per-bar cost is a few float ops instead of an object snapshot + dispatch.
+  async _runBatch(strategy, symbol, columns) {
+    const { actions, amounts } = await strategy.generateSignalsBatch(columns);
+    const n = columns.length;
+    const close = columns.close;
+    const equity = new Float64Array(n);
+
+    const state = { cash: this.initialCapital, position: 0 };
+    for (let i = 0; i < n; i += 1) {
+      const action = actions[i];
+      if (action !== 0) {
+        const execPrice = applyFill(state, action, close[i], amounts[i], this.commission, this.slippage);
+        if (execPrice > 0) {
+          this._recordTrade(action, symbol, amounts[i], execPrice, columns.timestamp[i]);
+        }
+      }
+      equity[i] = state.cash + state.position * close[i];
+    }
+
+    this.capital = state.cash;
+    this.positions[symbol] = state.position;
+    this.equityCurve = equity;
+    this.timestamps = columns.timestamp;
+    return this._calculateMetrics();
+  }
+
+  // Compatibility path for strategies that only implement per-bar
+  // generateSignal(snapshot). Slower: one snapshot per bar.
+  async _runPerBar(strategy, primarySymbol, historicalData, columns) {
+    const barCount = columns.length;
+    const timestamps = columns.timestamp;
+    // One struct-of-arrays view per symbol, built once per run and mutated in
+    // place per bar: strategies read the typed columns up to view.end instead
+    // of receiving a fresh nested object and row slice every bar.
+    this._views = {};
+    this._viewList = [];
+    const marketData = {};
+    for (const [symbol, symbolRows] of Object.entries(historicalData)) {
+      const view = {
+        columns: symbol === primarySymbol ? columns : asColumns(symbolRows),
+        end: 0,
+        ticker: { last: 0, high: 0, low: 0, volume: 0, timestamp: 0 },
+      };
+      this._views[symbol] = view;
+      this._viewList.push(view);
+      marketData[symbol] = view;
+    }
+    // Preallocate the curve buffers once: index assignment into a Float64Array
+    // instead of growing a plain array of boxed numbers per bar.
+    this.equityCurve = new Float64Array(barCount);
+    this.timestamps = new Float64Array(barCount);
+    for (let bar = 0; bar < barCount; bar += 1) {
+      const timestamp = timestamps[bar];
+      this._advanceMarketViews(timestamp);
+      const signal = await strategy.generateSignal(marketData);
+      if (signal) {
+        this._executeBacktestSignal(signal, marketData);
+      }
+      let equity = this.capital;
+      // for...in over positions: no per-bar entries array like Object.entries.
+      for (const symbol in this.positions) {
+        const view = marketData[symbol];
+        if (view !== undefined && view.end > 0) {
+          equity += this.positions[symbol] * view.ticker.last;
+        }
+      }
+      this.equityCurve[bar] = equity;
+      this.timestamps[bar] = timestamp;
+    }
+    return this._calculateMetrics();
+  }
+
+  // Timestamps advance monotonically within a run, so each view keeps a
+  // cursor (view.end) bumped forward per bar: O(N) amortized over the whole
+  // backtest, no per-bar scan or allocation. The ticker struct is updated in
+  // place from the typed columns.
+  _advanceMarketViews(timestamp) {
+    for (const view of this._viewList) {
+      const cols = view.columns;
+      let end = view.end;
+      while (end < cols.length && cols.timestamp[end] <= timestamp) {
+        end += 1;
+      }
+      view.end = end;
+      if (end > 0) {
+        const i = end - 1;
+        const ticker = view.ticker;
+        ticker.last = cols.close[i];
+        ticker.high = cols.high[i];
+        ticker.low = cols.low[i];
+        ticker.volume = cols.volume[i];
+        ticker.timestamp = cols.timestamp[i];
+      }
+    }
+  }
+
+  _executeBacktestSignal(signal, marketData) {
+    // One destructuring read of the signal, then cheapest rejections first:
+    // no repeated property walks on the per-bar path.
+    const { action, symbol, amount = 0 } = signal;
+    const actionCode = action === 'buy' ? 1 : action === 'sell' ? -1 : 0;
+    if (actionCode === 0 || amount <= 0) {
+      return;
+    }
+    const view = marketData[symbol];
+    if (view === undefined || view.end === 0) {
+      return;
+    }
+    const state = this._fillState;
+    state.cash = this.capital;
+    state.position = this.positions[symbol] || 0;
+    const execPrice = applyFill(state, actionCode, view.ticker.last, amount, this.commission, this.slippage);
+    if (execPrice > 0) {
+      this.capital = state.cash;
+      this.positions[symbol] = state.position;
+      this._recordTrade(actionCode, symbol, amount, execPrice, view.ticker.timestamp);
+    }
+  }
+
+  _recordTrade(actionCode, symbol, amount, price, timestamp) {
+    const i = this._tradeCount;
+    if (i === this._tradeActions.length) {
+      this._growTradeTape();
+    }
+    let symbolId = this._symbolIds.get(symbol);
+    if (symbolId === undefined) {
+      symbolId = this._symbolTable.length;
+      this._symbolTable.push(symbol);
+      this._symbolIds.set(symbol, symbolId);
+    }
+    this._tradeActions[i] = actionCode;
+    this._tradeSymbolIds[i] = symbolId;
+    this._tradeAmounts[i] = amount;
+    this._tradePrices[i] = price;
+    this._tradeTimestamps[i] = timestamp;
+    this._tradeCount = i + 1;
+  }
+
+  _growTradeTape() {
+    const grow = (buf, Ctor) => {
+      const next = new Ctor(buf.length * 2);
+      next.set(buf);
+      return next;
+    };
+    this._tradeActions = grow(this._tradeActions, Int8Array);
+    this._tradeSymbolIds = grow(this._tradeSymbolIds, Int32Array);
+    this._tradeAmounts = grow(this._tradeAmounts, Float64Array);
+    this._tradePrices = grow(this._tradePrices, Float64Array);
+    this._tradeTimestamps = grow(this._tradeTimestamps, Float64Array);
+  }
+
+  _materializeTrades() {
+    const trades = new Array(this._tradeCount);
+    for (let i = 0; i < this._tradeCount; i += 1) {
+      trades[i] = {
+        action: this._tradeActions[i] > 0 ? 'buy' : 'sell',
+        symbol: this._symbolTable[this._tradeSymbolIds[i]],
+        amount: this._tradeAmounts[i],
+        price: this._tradePrices[i],
+        timestamp: this._tradeTimestamps[i],
+      };
+    }
+    return trades;
+  }
+
+  _calculateMetrics() {
+    const equity = this.equityCurve;
+    const n = equity.length;
+    const metrics = n < 2
+      ? { totalReturn: 0, volatility: 0, sharpeRatio: 0, maxDrawdown: 0, finalEquity: this.initialCapital }
+      : metricsKernel(equity);
+    if (n >= 2) {
+      metrics.finalEquity = equity[n - 1];
+    }
+    metrics.tradeCount = this._tradeCount;
+    // Trades materialize to row objects only when read, then stay cached.
+    let materialized = null;
+    Object.defineProperty(metrics, 'trades', {
+      enumerable: true,
+      configurable: true,
+      get: () => {
+        if (materialized === null) {
+          materialized = this._materializeTrades();
+        }
+        return materialized;
+      },
+    });
+    return metrics;
+  }
+}
+
+module.exports = { Backtester, toColumns, OHLCV_COLUMNS };
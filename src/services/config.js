@@ -0,0 +1,38 @@
+require('dotenv').config();
+
+// Reading process.env crosses into the runtime on every access, so the
+// environment is snapshotted once and the derived config object is cached:
+// every caller of loadConfig() shares the same frozen instance.
+let cached = null;
+
+function buildConfig(env) {
+  return Object.freeze({
+    port: Number(env.PORT) || 3000,
+    logLevel: env.LOG_LEVEL || '',
+    endpoint: env.ENDPOINT || '',
+    backtest: Object.freeze({
+      initialCapital: Number(env.INITIAL_CAPITAL) || 10000,
+      commission: Number(env.COMMISSION) || 0.001,
+      slippage: Number(env.SLIPPAGE) || 0.0005,
+    }),
+    engine: Object.freeze({
+      symbols: (env.SYMBOLS || 'BTC/USDT').split(',').map((s) => s.trim()),
+      cycleIntervalMs: Number(env.CYCLE_INTERVAL_MS) || 60000,
+      defaultExchange: env.DEFAULT_EXCHANGE || 'paper',
+      tickerTtlMs: env.TICKER_TTL_MS !== undefined ? Number(env.TICKER_TTL_MS) : 500,
+    }),
+  });
+}
+
+function loadConfig() {
+  if (cached === null) {
+    cached = buildConfig(process.env);
+  }
+  return cached;
+}
+
+function resetConfigCache() {
+  cached = null;
+}
+
+module.exports = { loadConfig, resetConfigCache };
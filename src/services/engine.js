@@ -0,0 +1,325 @@
+// Orchestrates the live trading cycle: market data in, strategies and agents
+// evaluated, execution routed through the exchange manager. Kept separate
+// from the HTTP layer; routes only call into the engine.
+
+// Fixed-capacity typed-column buffer holding one symbol's candle history.
+// `length` tracks the filled prefix; every downstream kernel reads through
+// that cursor, so capacity can exceed the visible window.
+function allocHistory(capacity) {
+  return {
+    columns: {
+      length: 0,
+      timestamp: new Float64Array(capacity),
+      open: new Float64Array(capacity),
+      high: new Float64Array(capacity),
+      low: new Float64Array(capacity),
+      close: new Float64Array(capacity),
+      volume: new Float64Array(capacity),
+    },
+    capacity,
+    lastTimestamp: -Infinity,
+  };
+}
+
+class TradingEngine {
+  constructor({ exchangeManager, agentSwarm = null, config = {} } = {}) {
+    this.exchangeManager = exchangeManager;
+    this.agentSwarm = agentSwarm;
+    this.config = config;
+    this.symbols = config.symbols || ['BTC/USDT'];
+    this.cycleIntervalMs = config.cycleIntervalMs || 60000;
+    this.ohlcvLimit = config.ohlcvLimit || 100;
+    this.strategies = [];
+    this.running = false;
+    this._cycleTimer = null;
+    // Latest pushed ticker per symbol when the venue streams; symbols
+    // covered by a stream skip the per-cycle ticker fetch entirely.
+    this._liveTickers = {};
+    // Per-symbol candle history: after the first full fetch, each cycle
+    // requests only candles since the newest one held and appends them.
+    this._history = {};
+    // Fetching and evaluation are decoupled through a bounded snapshot
+    // queue: the producer keeps pulling fresh market data on schedule even
+    // when strategies or the swarm run long, and once the queue is full the
+    // oldest (stalest) snapshot is dropped rather than the newest.
+    this._queue = [];
+    this._queueMax = config.queueMax || 8;
+    this._droppedCycles = 0;
+    this._draining = false;
+    // Views container reused across cycles: the symbol set is stable, so
+    // the per-symbol {columns, end, ticker} entries are fixed-shape objects
+    // updated in place rather than rebuilt every evaluation. Only one drain
+    // runs at a time, so the container is never live in two cycles at once.
+    this._views = {};
+    this._unsubscribers = [];
+    this.portfolio = {
+      cash: config.initialCapital || 10000,
+      positions: {},
+    };
+    // /status and /health get polled every second by orchestrators; the
+    // aggregate snapshot is memoized for a short TTL so steady polling does
+    // not re-walk strategies and positions on every request.
+    this._statusTtlMs = config.statusTtlMs || 250;
+    this._statusSnapshot = null;
+    this._statusAt = 0;
+  }
+
+  addStrategy(strategy) {
+    this.strategies.push(strategy);
+    this._statusSnapshot = null;
+  }
+
+  start() {
+    if (this.running) {
+      return;
+    }
+    this.running = true;
+    this._statusSnapshot = null;
+    // Prefer push streams where the venue offers them: tick arrival updates
+    // _liveTickers and the polling cycle stops re-requesting those symbols.
+    for (const symbol of this.symbols) {
+      const unsubscribe = this.exchangeManager.watchTicker(symbol, (ticker) => {
+        this._liveTickers[symbol] = ticker;
+      });
+      if (unsubscribe) {
+        this._unsubscribers.push(unsubscribe);
+      }
+    }
+    const loop = async () => {
+      if (!this.running) {
+        return;
+      }
+      try {
+        await this._produceCycle();
+      } catch (err) {
+        // A failed cycle must not kill the loop; surface it and carry on.
+        // eslint-disable-next-line no-console
+        console.error('cycle failed:', err.message);
+      }
+      if (this.running) {
+        this._cycleTimer = setTimeout(loop, this.cycleIntervalMs);
+        this._cycleTimer.unref();
+      }
+    };
+    loop();
+  }
+
+  stop() {
+    this.running = false;
+    this._statusSnapshot = null;
+    if (this._cycleTimer) {
+      clearTimeout(this._cycleTimer);
+      this._cycleTimer = null;
+    }
+    for (const unsubscribe of this._unsubscribers) {
+      unsubscribe();
+    }
+    this._unsubscribers = [];
+    this._liveTickers = {};
+    this._queue = [];
+  }
+
+  // Producer half: fetch a snapshot, enqueue it, kick the consumer. When
+  // evaluation has fallen behind and the queue is full, the oldest snapshot
+  // is discarded — acting on stale data is worse than skipping it.
+  async _produceCycle() {
+    const marketData = await this._fetchMarketData();
+    if (this._queue.length >= this._queueMax) {
+      this._queue.shift();
+      this._droppedCycles += 1;
+    }
+    this._queue.push(marketData);
+    if (!this._draining) {
+      this._draining = true;
+      setImmediate(() => this._drainQueue());
+    }
+  }
+
+  // Consumer half: runs snapshots through strategies, swarm and execution
+  // until the queue empties. At most one drain is in flight at a time.
+  async _drainQueue() {
+    try {
+      while (this.running && this._queue.length > 0) {
+        await this._evaluateCycle(this._queue.shift());
+      }
+    } catch (err) {
+      // eslint-disable-next-line no-console
+      console.error('cycle failed:', err.message);
+    } finally {
+      this._draining = false;
+    }
+  }
+
+  async _evaluateCycle(marketData) {
+    const views = this._views;
+    for (const symbol in views) {
+      if (marketData[symbol] === undefined) {
+        delete views[symbol];
+      }
+    }
+    for (const symbol in marketData) {
+      const { ticker, columns } = marketData[symbol];
+      let view = views[symbol];
+      if (view === undefined) {
+        view = { columns: null, end: 0, ticker: null };
+        views[symbol] = view;
+      }
+      view.columns = columns;
+      view.end = columns.length;
+      view.ticker = ticker;
+    }
+    const signals = [];
+    // Strategy evaluation is synchronous CPU work; a macrotask hop between
+    // strategies gives pending I/O (health and status polls, venue sockets)
+    // a turn, so a large roster cannot starve the event loop for a whole
+    // cycle.
+    for (const strategy of this.strategies) {
+      const signal = await strategy.generateSignal(views);
+      if (signal) {
+        signals.push(signal);
+      }
+      await new Promise((resolve) => { setImmediate(resolve); });
+    }
+    const approved = this.agentSwarm
+      ? await this.agentSwarm.processSignals(signals, marketData)
+      : signals;
+    for (const signal of approved) {
+      this._executeSignal(signal, marketData);
+    }
+    this._updatePortfolio(marketData);
+  }
+
+  // Tickers for the whole symbol list come back from one fetchTickers batch
+  // call while per-symbol OHLCV requests run concurrently beside it: a cycle
+  // costs the slowest single fetch, with O(1) ticker round-trips instead of
+  // one per symbol. A symbol whose fetch fails is skipped for the cycle.
+  async _fetchMarketData() {
+    // Property chains walked on every iteration are hoisted to locals once.
+    const symbols = this.symbols;
+    const liveTickers = this._liveTickers;
+    const polledSymbols = symbols.filter((symbol) => liveTickers[symbol] === undefined);
+    const [tickersResult, ...ohlcvResults] = await Promise.allSettled([
+      polledSymbols.length > 0 ? this.exchangeManager.fetchTickers(polledSymbols) : {},
+      ...symbols.map((symbol) => this._fetchCandles(symbol)),
+    ]);
+    const polled = tickersResult.status === 'fulfilled' ? tickersResult.value : {};
+    const marketData = {};
+    for (let i = 0; i < symbols.length; i += 1) {
+      const symbol = symbols[i];
+      const ticker = liveTickers[symbol] || polled[symbol];
+      if (ticker && ohlcvResults[i].status === 'fulfilled') {
+        marketData[symbol] = { ticker, columns: ohlcvResults[i].value };
+      }
+    }
+    return marketData;
+  }
+
+  // First call pulls the full lookback; after that only candles since the
+  // newest one held are requested and merged, so steady-state cycles move a
+  // couple of rows over the wire instead of the whole window.
+  async _fetchCandles(symbol) {
+    const history = this._history[symbol];
+    const opts = { limit: this.ohlcvLimit };
+    if (history) {
+      // Re-request from the last timestamp so the still-forming candle gets
+      // refreshed in place.
+      opts.since = history.lastTimestamp;
+    }
+    const rows = await this.exchangeManager.fetchOHLCV(symbol, opts);
+    return this._appendCandles(symbol, rows);
+  }
+
+  _appendCandles(symbol, rows) {
+    let history = this._history[symbol];
+    if (!history) {
+      history = allocHistory(this.ohlcvLimit);
+      this._history[symbol] = history;
+    }
+    const cols = history.columns;
+    for (const row of rows) {
+      const ts = row[0];
+      let i;
+      if (cols.length > 0 && ts === history.lastTimestamp) {
+        i = cols.length - 1;
+      } else if (ts <= history.lastTimestamp) {
+        continue;
+      } else if (cols.length === history.capacity) {
+        // Window full: slide everything left one slot. One candle lands per
+        // cycle in steady state, so the shift stays off any hot path.
+        cols.timestamp.copyWithin(0, 1);
+        cols.open.copyWithin(0, 1);
+        cols.high.copyWithin(0, 1);
+        cols.low.copyWithin(0, 1);
+        cols.close.copyWithin(0, 1);
+        cols.volume.copyWithin(0, 1);
+        i = cols.length - 1;
+      } else {
+        i = cols.length;
+        cols.length += 1;
+      }
+      cols.timestamp[i] = ts;
+      cols.open[i] = row[1];
+      cols.high[i] = row[2];
+      cols.low[i] = row[3];
+      cols.close[i] = row[4];
+      cols.volume[i] = row[5];
+      history.lastTimestamp = ts;
+    }
+    return cols;
+  }
+
+  _executeSignal(signal, marketData) {
+    const { action, symbol, amount = 0 } = signal;
+    const data = marketData[symbol];
+    if (!data || amount <= 0) {
+      return;
+    }
+    const price = data.ticker.last;
+    const portfolio = this.portfolio;
+    const positions = portfolio.positions;
+    const cost = price * amount;
+    if (action === 'buy' && cost <= portfolio.cash) {
+      portfolio.cash -= cost;
+      positions[symbol] = (positions[symbol] || 0) + amount;
+    } else if (action === 'sell' && (positions[symbol] || 0) >= amount) {
+      portfolio.cash += cost;
+      positions[symbol] -= amount;
+    }
+    this._statusSnapshot = null;
+  }
+
+  _updatePortfolio(marketData) {
+    const portfolio = this.portfolio;
+    const positions = portfolio.positions;
+    let value = portfolio.cash;
+    for (const symbol in positions) {
+      const data = marketData[symbol];
+      if (data) {
+        value += positions[symbol] * data.ticker.last;
+      }
+    }
+    portfolio.value = value;
+  }
+
+  getStatus() {
+    const now = Date.now();
+    if (this._statusSnapshot !== null && now - this._statusAt < this._statusTtlMs) {
+      return this._statusSnapshot;
+    }
+    const snapshot = {
+      running: this.running,
+      strategies: this.strategies.map((s) => s.constructor.name),
+      exchanges: Object.keys(this.exchangeManager ? this.exchangeManager.exchanges : {}),
+      cash: this.portfolio.cash,
+      positions: { ...this.portfolio.positions },
+      queueDepth: this._queue.length,
+      droppedCycles: this._droppedCycles,
+      timestamp: now,
+    };
+    this._statusSnapshot = snapshot;
+    this._statusAt = now;
+    return snapshot;
+  }
+}
+
+module.exports = { TradingEngine };
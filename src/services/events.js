@@ -0,0 +1,19 @@
+// Fixed-shape event objects for the strategy -> swarm -> engine pipeline.
+// Every field is assigned in the constructor, in the same order, so all
+// instances share one hidden class and field reads on the hot path stay
+// monomorphic — the closest Node analog to slotted frozen dataclasses.
+class SignalEvent {
+  constructor(action, symbol, amount, price = null, consensusScore = 0) {
+    this.action = action;
+    this.symbol = symbol;
+    this.amount = amount;
+    this.price = price;
+    this.consensusScore = consensusScore;
+  }
+
+  withConsensus(consensusScore) {
+    return new SignalEvent(this.action, this.symbol, this.amount, this.price, consensusScore);
+  }
+}
+
+module.exports = { SignalEvent };
@@ -0,0 +1,150 @@
+// Market-connectivity boundary. Venues plug in as adapter objects exposing
+// fetchTicker/fetchOrderBook/fetchOHLCV; everything above this module talks
+// symbols and plain data, never venue SDKs.
+const { performance } = require('node:perf_hooks');
+const { Agent: HttpAgent } = require('node:http');
+const { Agent: HttpsAgent } = require('node:https');
+
+class ExchangeManager {
+  constructor(config = {}) {
+    this.exchanges = {};
+    this.defaultExchange = config.defaultExchange || 'paper';
+    // Within one engine cycle the same ticker is wanted by market-data
+    // fetch, feature extraction and portfolio revaluation. A short TTL cache
+    // keyed on (exchange, symbol) against the monotonic clock collapses
+    // those into one venue round-trip. ttl <= 0 disables caching.
+    this.tickerTtlMs = config.tickerTtlMs !== undefined ? config.tickerTtlMs : 500;
+    this._tickerCache = new Map();
+    // Almost every call routes to the default venue; the adapter is bound
+    // here at connect time so the hot path skips the name -> adapter lookup.
+    this._defaultAdapter = null;
+    // One keep-alive connection pool shared across every HTTP-backed venue,
+    // built lazily: TCP/TLS setup is paid once per host, not per request.
+    this._httpAgents = null;
+  }
+
+  _sharedHttpAgents() {
+    if (!this._httpAgents) {
+      this._httpAgents = {
+        http: new HttpAgent({ keepAlive: true, maxSockets: 16 }),
+        https: new HttpsAgent({ keepAlive: true, maxSockets: 16 }),
+      };
+    }
+    return this._httpAgents;
+  }
+
+  _cachedTicker(name, symbol, now) {
+    const entry = this._tickerCache.get(`${name}:${symbol}`);
+    return entry && now - entry.at < this.tickerTtlMs ? entry.ticker : null;
+  }
+
+  _storeTicker(name, symbol, ticker, now) {
+    this._tickerCache.set(`${name}:${symbol}`, { at: now, ticker });
+  }
+
+  connect(name, adapter) {
+    // HTTP-backed adapters opt into the shared keep-alive pool; in-process
+    // venues (paper) simply do not expose the hook.
+    if (typeof adapter.setHttpAgents === 'function') {
+      adapter.setHttpAgents(this._sharedHttpAgents());
+    }
+    this.exchanges[name] = adapter;
+    if (name === this.defaultExchange) {
+      this._defaultAdapter = adapter;
+    }
+    return adapter;
+  }
+
+  getExchange(exchangeName) {
+    if (!exchangeName || exchangeName === this.defaultExchange) {
+      if (this._defaultAdapter) {
+        return this._defaultAdapter;
+      }
+      throw new Error(`unknown exchange: ${this.defaultExchange}`);
+    }
+    const exchange = this.exchanges[exchangeName];
+    if (!exchange) {
+      throw new Error(`unknown exchange: ${exchangeName}`);
+    }
+    return exchange;
+  }
+
+  async fetchTicker(symbol, exchangeName) {
+    const name = exchangeName || this.defaultExchange;
+    const now = performance.now();
+    const cached = this._cachedTicker(name, symbol, now);
+    if (cached) {
+      return cached;
+    }
+    const ticker = await this.getExchange(name).fetchTicker(symbol);
+    this._storeTicker(name, symbol, ticker, now);
+    return ticker;
+  }
+
+  // One venue round-trip for a whole symbol list when the adapter supports
+  // it; otherwise the per-symbol calls at least run concurrently. Fresh
+  // cache entries are served directly and only stale symbols are fetched.
+  // Returns a symbol -> ticker map.
+  async fetchTickers(symbols, exchangeName) {
+    const name = exchangeName || this.defaultExchange;
+    const now = performance.now();
+    const tickers = {};
+    const stale = [];
+    for (const symbol of symbols) {
+      const cached = this._cachedTicker(name, symbol, now);
+      if (cached) {
+        tickers[symbol] = cached;
+      } else {
+        stale.push(symbol);
+      }
+    }
+    if (stale.length === 0) {
+      return tickers;
+    }
+    const exchange = this.getExchange(name);
+    if (typeof exchange.fetchTickers === 'function') {
+      const fetched = await exchange.fetchTickers(stale);
+      for (const symbol of stale) {
+        if (fetched[symbol]) {
+          tickers[symbol] = fetched[symbol];
+          this._storeTicker(name, symbol, fetched[symbol], now);
+        }
+      }
+    } else {
+      await Promise.all(stale.map(async (symbol) => {
+        const ticker = await exchange.fetchTicker(symbol);
+        tickers[symbol] = ticker;
+        this._storeTicker(name, symbol, ticker, now);
+      }));
+    }
+    return tickers;
+  }
+
+  // Depth is forwarded to the venue so only `limit` levels ever cross the
+  // wire, instead of pulling a full book and slicing it here.
+  async fetchOrderBook(symbol, { limit = 10, exchangeName } = {}) {
+    return this.getExchange(exchangeName).fetchOrderBook(symbol, limit);
+  }
+
+  async fetchOHLCV(symbol, { timeframe = '1h', limit = 100, since, exchangeName } = {}) {
+    return this.getExchange(exchangeName).fetchOHLCV(symbol, { timeframe, limit, since });
+  }
+
+  // Push-based ticker stream for venues that support it (websocket feeds).
+  // handler(ticker) is invoked on every update and the cache is kept warm as
+  // a side effect, so polling callers also benefit. Returns an unsubscribe
+  // function, or null when the venue is poll-only.
+  watchTicker(symbol, handler, exchangeName) {
+    const name = exchangeName || this.defaultExchange;
+    const exchange = this.getExchange(name);
+    if (typeof exchange.watchTicker !== 'function') {
+      return null;
+    }
+    return exchange.watchTicker(symbol, (ticker) => {
+      this._storeTicker(name, symbol, ticker, performance.now());
+      handler(ticker);
+    });
+  }
+}
+
+module.exports = { ExchangeManager };
@@ -0,0 +1,122 @@
+const os = require('node:os');
+const path = require('node:path');
+const { Worker, isMainThread, parentPort, workerData } = require('node:worker_threads');
+
+// Parameter-grid backtests are embarrassingly parallel: each combination is
+// an independent CPU-bound run. This module fans them out over a small
+// worker_threads pool; each worker receives the historical data once at
+// startup and then processes parameter sets from a shared job list.
+
+function expandGrid(paramGrid) {
+  let combos = [{}];
+  for (const [key, values] of Object.entries(paramGrid)) {
+    const next = [];
+    for (const combo of combos) {
+      for (const value of values) {
+        next.push({ ...combo, [key]: value });
+      }
+    }
+    combos = next;
+  }
+  return combos;
+}
+
+function resolveStrategyModule(module) {
+  if (path.isAbsolute(module)) {
+    return module;
+  }
+  return require.resolve(module.startsWith('.') ? module : `./${module}`);
+}
+
+function runGrid({ strategy, paramGrid, historicalData, backtest = {}, concurrency } = {}) {
+  const jobs = expandGrid(paramGrid || {});
+  if (jobs.length === 0) {
+    return Promise.resolve([]);
+  }
+  const modulePath = resolveStrategyModule(strategy.module);
+  const poolSize = Math.max(1, Math.min(concurrency || os.availableParallelism(), jobs.length));
+
+  return new Promise((resolve, reject) => {
+    const results = new Array(jobs.length);
+    const workers = [];
+    let nextJob = 0;
+    let completed = 0;
+    let settled = false;
+
+    const finish = (err) => {
+      if (settled) {
+        return;
+      }
+      settled = true;
+      for (const worker of workers) {
+        worker.terminate();
+      }
+      if (err) {
+        reject(err);
+      } else {
+        resolve(results);
+      }
+    };
+
+    for (let w = 0; w < poolSize; w += 1) {
+      const worker = new Worker(__filename, {
+        workerData: {
+          modulePath,
+          exportName: strategy.export,
+          baseConfig: strategy.config || {},
+          historicalData,
+          backtest,
+        },
+      });
+      workers.push(worker);
+
+      const feed = () => {
+        if (nextJob < jobs.length) {
+          const idx = nextJob;
+          nextJob += 1;
+          worker.postMessage({ idx, params: jobs[idx] });
+        }
+      };
+
+      worker.on('message', ({ idx, metrics, error }) => {
+        results[idx] = { params: jobs[idx], metrics: metrics || null, error: error || null };
+        completed += 1;
+        if (completed === jobs.length) {
+          finish();
+        } else {
+          feed();
+        }
+      });
+      worker.on('error', finish);
+      feed();
+    }
+  });
+}
+
+if (!isMainThread && parentPort) {
+  const { Backtester } = require('./backtester');
+  const StrategyClass = require(workerData.modulePath)[workerData.exportName];
+
+  parentPort.on('message', async ({ idx, params }) => {
+    try {
+      const backtester = new Backtester(workerData.backtest);
+      const strategyInstance = new StrategyClass({ ...workerData.baseConfig, ...params });
+      const metrics = await backtester.run(strategyInstance, workerData.historicalData);
+      parentPort.postMessage({
+        idx,
+        metrics: {
+          totalReturn: metrics.totalReturn,
+          volatility: metrics.volatility,
+          sharpeRatio: metrics.sharpeRatio,
+          maxDrawdown: metrics.maxDrawdown,
+          finalEquity: metrics.finalEquity,
+          tradeCount: metrics.tradeCount,
+        },
+      });
+    } catch (err) {
+      parentPort.postMessage({ idx, error: err.message });
+    }
+  });
+}
+
+module.exports = { runGrid, expandGrid };
@@ -0,0 +1,350 @@
+// Technical indicator helpers. All functions take plain numeric arrays and
+// return arrays of the same length, with NaN for warmup positions.
+
+// Optional native backend: when the talib-binding addon is installed its
+// TA-Lib C kernels take over and the JS implementations below become the
+// fallback. The addon returns only the valid suffix of each series, so
+// results are re-padded to full length with the NaN warmup callers expect.
+let talib = null;
+try {
+  // eslint-disable-next-line global-require, import/no-unresolved
+  talib = require('talib-binding');
+} catch (err) {
+  talib = null;
+}
+
+// Callers scanning many symbols can opt into Float32 outputs via the
+// trailing float32 flag, halving the bytes these memory-bound loops move;
+// threshold comparisons like RSI 30/70 are nowhere near float32 precision
+// limits. Internal recursion state stays float64.
+function allocOutput(n, float32) {
+  return float32 ? new Float32Array(n).fill(NaN) : new Array(n).fill(NaN);
+}
+
+function padWarmup(tail, n) {
+  const out = new Array(n).fill(NaN);
+  const offset = n - tail.length;
+  for (let i = 0; i < tail.length; i += 1) {
+    out[offset + i] = tail[i];
+  }
+  return out;
+}
+
+function calculateSma(values, period, float32 = false) {
+  if (talib) {
+    return padWarmup(talib.SMA(values, period), values.length);
+  }
+  const n = values.length;
+  const out = allocOutput(n, float32);
+  for (let i = period - 1; i < n; i += 1) {
+    let sum = 0;
+    for (let j = i - period + 1; j <= i; j += 1) {
+      sum += values[j];
+    }
+    out[i] = sum / period;
+  }
+  return out;
+}
+
+function calculateEma(values, period, float32 = false) {
+  if (talib) {
+    return padWarmup(talib.EMA(values, period), values.length);
+  }
+  // The geometric weight sums obey a one-pole recursion: decaying the
+  // running numerator and denominator each step reproduces the full
+  // weighted mean in O(n) instead of re-expanding the window per point.
+  // NaN inputs contribute nothing but still decay the carried state, so
+  // NaN-prefixed series (e.g. the MACD line) behave as before.
+  const n = values.length;
+  const decay = 1 - 2 / (period + 1);
+  const out = allocOutput(n, float32);
+  let num = 0;
+  let den = 0;
+  for (let i = 0; i < n; i += 1) {
+    num *= decay;
+    den *= decay;
+    const v = values[i];
+    if (!Number.isNaN(v)) {
+      num += v;
+      den += 1;
+    }
+    out[i] = den > 0 ? num / den : NaN;
+  }
+  return out;
+}
+
+// Wilder RSI core writing into out[base..base+n): shared by the single- and
+// multi-series entry points. Single pass, running averages carry all
+// history, no gain/loss temporaries and no rolling windows.
+function rsiInto(values, period, out, base) {
+  const n = values.length;
+  if (n <= period) {
+    return;
+  }
+  // The gain/loss split is branchless — Math.max compiles to a max
+  // instruction, so the loop carries no data-dependent branches for the
+  // predictor to miss on choppy price series.
+  let avgGain = 0;
+  let avgLoss = 0;
+  for (let i = 1; i <= period; i += 1) {
+    const delta = values[i] - values[i - 1];
+    avgGain += Math.max(delta, 0);
+    avgLoss += Math.max(-delta, 0);
+  }
+  avgGain /= period;
+  avgLoss /= period;
+  out[base + period] = avgLoss === 0 ? 100 : 100 - 100 / (1 + avgGain / avgLoss);
+  const decay = (period - 1) / period;
+  for (let i = period + 1; i < n; i += 1) {
+    const delta = values[i] - values[i - 1];
+    avgGain = avgGain * decay + Math.max(delta, 0) / period;
+    avgLoss = avgLoss * decay + Math.max(-delta, 0) / period;
+    out[base + i] = avgLoss === 0 ? 100 : 100 - 100 / (1 + avgGain / avgLoss);
+  }
+}
+
+function calculateRsi(values, period = 14, float32 = false) {
+  if (talib) {
+    return padWarmup(talib.RSI(values, period), values.length);
+  }
+  const out = allocOutput(values.length, float32);
+  rsiInto(values, period, out, 0);
+  return out;
+}
+
+// Batched RSI over many equal-length series (one per symbol), written into
+// a single contiguous (symbols x bars) row-major buffer. One call covers
+// the whole scan, so per-series dispatch is amortized across the symbol
+// axis and each row stays cache-contiguous.
+function calculateRsiBatch(seriesList, period = 14, float32 = false) {
+  const symbols = seriesList.length;
+  const bars = symbols > 0 ? seriesList[0].length : 0;
+  const data = float32 ? new Float32Array(symbols * bars) : new Float64Array(symbols * bars);
+  data.fill(NaN);
+  for (let r = 0; r < symbols; r += 1) {
+    rsiInto(seriesList[r], period, data, r * bars);
+  }
+  return { symbols, bars, data };
+}
+
+function calculateMacd(values, fastPeriod = 12, slowPeriod = 26, signalPeriod = 9, float32 = false) {
+  if (talib) {
+    const [macdTail, signalTail, histTail] = talib.MACD(values, fastPeriod, slowPeriod, signalPeriod);
+    return {
+      macd: padWarmup(macdTail, values.length),
+      signal: padWarmup(signalTail, values.length),
+      histogram: padWarmup(histTail, values.length),
+    };
+  }
+  // Fused kernel: the fast, slow and signal EMA recursions all advance in
+  // the same walk, writing macd/signal/histogram as they go — one pass over
+  // the data instead of three EMA sweeps plus two subtraction passes, with
+  // no intermediate arrays. States mirror calculateEma's weighted form.
+  const n = values.length;
+  const macd = allocOutput(n, float32);
+  const signal = allocOutput(n, float32);
+  const histogram = allocOutput(n, float32);
+  const fastDecay = 1 - 2 / (fastPeriod + 1);
+  const slowDecay = 1 - 2 / (slowPeriod + 1);
+  const signalDecay = 1 - 2 / (signalPeriod + 1);
+  let fastNum = 0;
+  let fastDen = 0;
+  let slowNum = 0;
+  let slowDen = 0;
+  let sigNum = 0;
+  let sigDen = 0;
+  for (let i = 0; i < n; i += 1) {
+    fastNum *= fastDecay;
+    fastDen *= fastDecay;
+    slowNum *= slowDecay;
+    slowDen *= slowDecay;
+    sigNum *= signalDecay;
+    sigDen *= signalDecay;
+    const v = values[i];
+    if (!Number.isNaN(v)) {
+      fastNum += v;
+      fastDen += 1;
+      slowNum += v;
+      slowDen += 1;
+    }
+    const m = fastDen > 0 ? fastNum / fastDen - slowNum / slowDen : NaN;
+    macd[i] = m;
+    if (!Number.isNaN(m)) {
+      sigNum += m;
+      sigDen += 1;
+    }
+    const g = sigDen > 0 ? sigNum / sigDen : NaN;
+    signal[i] = g;
+    histogram[i] = m - g;
+  }
+  return { macd, signal, histogram };
+}
+
+function calculateBollingerBands(values, period = 20, numStd = 2, float32 = false) {
+  if (talib) {
+    const [upperTail, middleTail, lowerTail] = talib.BBANDS(values, period, numStd, numStd);
+    return {
+      upper: padWarmup(upperTail, values.length),
+      middle: padWarmup(middleTail, values.length),
+      lower: padWarmup(lowerTail, values.length),
+    };
+  }
+  // Rolling sum and sum-of-squares carried add-new/subtract-old: each bar's
+  // mean and std come from O(1) state updates instead of re-scanning the
+  // window twice, taking the loop from O(n * period) to O(n). The variance
+  // is clamped at zero against floating-point cancellation.
+  const n = values.length;
+  const upper = allocOutput(n, float32);
+  const middle = allocOutput(n, float32);
+  const lower = allocOutput(n, float32);
+  let sum = 0;
+  let sumSq = 0;
+  for (let i = 0; i < n; i += 1) {
+    const v = values[i];
+    sum += v;
+    sumSq += v * v;
+    if (i >= period) {
+      const old = values[i - period];
+      sum -= old;
+      sumSq -= old * old;
+    }
+    if (i >= period - 1) {
+      const mean = sum / period;
+      const variance = Math.max(sumSq / period - mean * mean, 0);
+      const dev = numStd * Math.sqrt(variance);
+      middle[i] = mean;
+      upper[i] = mean + dev;
+      lower[i] = mean - dev;
+    }
+  }
+  return { upper, middle, lower };
+}
+
+// True-range scratch shared across calculateAtr calls, grown on demand.
+// Only the first n slots of any one call are meaningful; single-threaded
+// module, so no call ever observes another's contents.
+let atrScratch = new Float64Array(0);
+
+function calculateAtr(high, low, close, period = 14, float32 = false) {
+  if (talib) {
+    return padWarmup(talib.ATR(high, low, close, period), close.length);
+  }
+  // True range is reduced per bar as three scalar comparisons instead of
+  // three candidate arrays plus a map, and the rolling mean is carried as an
+  // add-new/subtract-old running sum — one pass, no fresh temporaries.
+  const n = close.length;
+  const out = allocOutput(n, float32);
+  if (atrScratch.length < n) {
+    atrScratch = new Float64Array(n);
+  }
+  const trueRange = atrScratch;
+  let sum = 0;
+  for (let i = 0; i < n; i += 1) {
+    const prevClose = i > 0 ? close[i - 1] : close[i];
+    const hl = high[i] - low[i];
+    const hc = Math.abs(high[i] - prevClose);
+    const lc = Math.abs(low[i] - prevClose);
+    let tr = hl > hc ? hl : hc;
+    if (lc > tr) {
+      tr = lc;
+    }
+    trueRange[i] = tr;
+    sum += tr;
+    if (i >= period) {
+      sum -= trueRange[i - period];
+    }
+    if (i >= period - 1) {
+      out[i] = sum / period;
+    }
+  }
+  return out;
+}
+
+// Runs every kernel a few times over a small synthetic series so V8
+// observes the types and tiers the loops up before real data arrives —
+// the first live tick should not pay optimizing-compiler warmup. Called
+// once at service boot; costs well under a millisecond.
+function warmupIndicators() {
+  const n = 64;
+  const xs = new Array(n);
+  for (let i = 0; i < n; i += 1) {
+    xs[i] = 100 + Math.sin(i / 5);
+  }
+  for (let pass = 0; pass < 3; pass += 1) {
+    calculateSma(xs, 14);
+    calculateEma(xs, 14);
+    calculateRsi(xs, 14);
+    calculateRsiBatch([xs], 14);
+    calculateMacd(xs);
+    calculateBollingerBands(xs);
+    calculateAtr(xs, xs, xs, 14);
+    normalizeData(xs);
+  }
+}
+
+function normalizeData(values) {
+  // Min/max sweep and rescale are unrolled four wide: independent
+  // accumulator lanes break the per-element dependency chain so the CPU
+  // can retire several elements per cycle, the closest this runtime gets
+  // to explicit SIMD for a data-parallel loop.
+  const n = values.length;
+  let min0 = Infinity;
+  let min1 = Infinity;
+  let min2 = Infinity;
+  let min3 = Infinity;
+  let max0 = -Infinity;
+  let max1 = -Infinity;
+  let max2 = -Infinity;
+  let max3 = -Infinity;
+  const n4 = n - (n % 4);
+  for (let i = 0; i < n4; i += 4) {
+    const a = values[i];
+    const b = values[i + 1];
+    const c = values[i + 2];
+    const d = values[i + 3];
+    min0 = a < min0 ? a : min0;
+    min1 = b < min1 ? b : min1;
+    min2 = c < min2 ? c : min2;
+    min3 = d < min3 ? d : min3;
+    max0 = a > max0 ? a : max0;
+    max1 = b > max1 ? b : max1;
+    max2 = c > max2 ? c : max2;
+    max3 = d > max3 ? d : max3;
+  }
+  let min = Math.min(Math.min(min0, min1), Math.min(min2, min3));
+  let max = Math.max(Math.max(max0, max1), Math.max(max2, max3));
+  for (let i = n4; i < n; i += 1) {
+    const v = values[i];
+    min = v < min ? v : min;
+    max = v > max ? v : max;
+  }
+  const out = new Array(n);
+  const range = max - min;
+  if (range > 0) {
+    const scale = 1 / range;
+    for (let i = 0; i < n4; i += 4) {
+      out[i] = (values[i] - min) * scale;
+      out[i + 1] = (values[i + 1] - min) * scale;
+      out[i + 2] = (values[i + 2] - min) * scale;
+      out[i + 3] = (values[i + 3] - min) * scale;
+    }
+    for (let i = n4; i < n; i += 1) {
+      out[i] = (values[i] - min) * scale;
+    }
+  } else {
+    out.fill(0);
+  }
+  return out;
+}
+
+module.exports = {
+  calculateSma,
+  calculateEma,
+  calculateRsi,
+  calculateRsiBatch,
+  calculateMacd,
+  calculateBollingerBands,
+  calculateAtr,
+  normalizeData,
+  warmupIndicators,
+};
@@ -0,0 +1,91 @@
+// Synthetic OHLCV for examples, self-tests and backtest previews.
+// All randomness comes from one seeded generator pass into a float32 noise
+// buffer, so generation is reproducible and the columns stay compact.
+
+function mulberry32(seed) {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) | 0;
+    let t = Math.imul(state ^ (state >>> 15), 1 | state);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+// Box-Muller over the uniform stream; filled pairwise in a single pass.
+function standardNormal(n, rand) {
+  const out = new Float32Array(n);
+  for (let i = 0; i < n; i += 2) {
+    const u = Math.max(rand(), 1e-12);
+    const v = rand();
+    const radius = Math.sqrt(-2 * Math.log(u));
+    out[i] = radius * Math.cos(2 * Math.PI * v);
+    if (i + 1 < n) {
+      out[i + 1] = radius * Math.sin(2 * Math.PI * v);
+    }
+  }
+  return out;
+}
+
+// Generation is deterministic in its parameters, so identical requests
+// (self-test fixtures, repeated previews, scripts) share one memoized set
+// of buffers instead of regenerating them. Shared series are read-only by
+// convention — every consumer in this service only reads the columns.
+const seriesMemo = new Map();
+
+function generateSampleData({ days = 365, startPrice = 100, startTime = 0, seed = 42 } = {}) {
+  const memoKey = `${days}:${startPrice}:${startTime}:${seed}`;
+  const memoized = seriesMemo.get(memoKey);
+  if (memoized) {
+    return memoized;
+  }
+  const n = days * 24;
+  const rand = mulberry32(seed);
+  // One noise buffer for all four stochastic columns: [return, wickHi, wickLo, volume].
+  const noise = standardNormal(n * 4, rand);
+
+  const cols = {
+    length: n,
+    timestamp: new Float64Array(n),
+    open: new Float32Array(n),
+    high: new Float32Array(n),
+    low: new Float32Array(n),
+    close: new Float32Array(n),
+    volume: new Float32Array(n),
+  };
+
+  let price = startPrice;
+  for (let i = 0; i < n; i += 1) {
+    const base = i * 4;
+    const open = price;
+    price *= 1 + noise[base] * 0.01;
+    const close = price;
+    const span = Math.max(open, close);
+    cols.timestamp[i] = startTime + i * 3600000;
+    cols.open[i] = open;
+    cols.close[i] = close;
+    cols.high[i] = span * (1 + Math.abs(noise[base + 1]) * 0.002);
+    cols.low[i] = Math.min(open, close) * (1 - Math.abs(noise[base + 2]) * 0.002);
+    cols.volume[i] = 100 * Math.exp(noise[base + 3] * 0.5);
+  }
+  seriesMemo.set(memoKey, cols);
+  return cols;
+}
+
+// Row materializer for callers that still consume row objects.
+function columnsToRows(cols) {
+  const rows = new Array(cols.length);
+  for (let i = 0; i < cols.length; i += 1) {
+    rows[i] = {
+      timestamp: cols.timestamp[i],
+      open: cols.open[i],
+      high: cols.high[i],
+      low: cols.low[i],
+      close: cols.close[i],
+      volume: cols.volume[i],
+    };
+  }
+  return rows;
+}
+
+module.exports = { generateSampleData, columnsToRows, mulberry32 };
@@ -0,0 +1,18 @@
+const { MomentumStrategy } = require('./momentum');
+
+// Strategy classes are imported once at module load and resolved by name,
+// so adding a strategy at runtime is a registry lookup plus a constructor
+// call — no per-request module resolution.
+const STRATEGY_REGISTRY = Object.freeze({
+  momentum: MomentumStrategy,
+});
+
+function createStrategy(type, config = {}) {
+  const StrategyClass = STRATEGY_REGISTRY[type];
+  if (!StrategyClass) {
+    return null;
+  }
+  return new StrategyClass(config);
+}
+
+module.exports = { STRATEGY_REGISTRY, createStrategy };
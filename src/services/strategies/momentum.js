@@ -0,0 +1,162 @@
+const { SignalEvent } = require('../events');
+
+// RSI + MACD crossover momentum strategy. Consumes the struct-of-arrays
+// market views produced by the backtester (and later the live engine):
+// typed OHLCV columns plus an `end` cursor marking the visible window.
+class MomentumStrategy {
+  constructor(config = {}) {
+    this.config = config;
+    this.symbol = config.symbol || 'BTC/USDT';
+    this.rsiPeriod = config.rsiPeriod || 14;
+    this.rsiOversold = config.rsiOversold || 30;
+    this.rsiOverbought = config.rsiOverbought || 70;
+    this.macdFast = config.macdFast || 12;
+    this.macdSlow = config.macdSlow || 26;
+    this.macdSignal = config.macdSignal || 9;
+    this.positionSize = config.positionSize || 0.1;
+    // Indicator cache: RSI and MACD are IIR recursions, so when the market
+    // view has only grown the carried states advance over the new bars —
+    // O(new bars) per tick instead of recomputing the whole window. Keyed on
+    // (end, last timestamp); a refreshed still-forming candle therefore
+    // reuses cached values until the bar closes.
+    this._cache = null;
+    this._fastDecay = 1 - 2 / (this.macdFast + 1);
+    this._slowDecay = 1 - 2 / (this.macdSlow + 1);
+    this._signalDecay = 1 - 2 / (this.macdSignal + 1);
+    // Thresholds never change after construction, so the crossover check is
+    // specialised once into a closure with them bound as captured locals —
+    // the per-tick path does plain local reads instead of property loads.
+    const oversold = this.rsiOversold;
+    const overbought = this.rsiOverbought;
+    this._classify = (rsi, macdPrev, signalPrev, macdLast, signalLast) => {
+      if (rsi < oversold && macdPrev <= signalPrev && macdLast > signalLast) {
+        return 'buy';
+      }
+      if (rsi > overbought && macdPrev >= signalPrev && macdLast < signalLast) {
+        return 'sell';
+      }
+      return null;
+    };
+  }
+
+  minBars() {
+    return Math.max(this.macdSlow + this.macdSignal, this.rsiPeriod + 1);
+  }
+
+  async generateSignal(marketData) {
+    const view = marketData[this.symbol];
+    if (!view || view.end < this.minBars()) {
+      return null;
+    }
+    const ind = this._addIndicators(view);
+    if (!ind || ind.rsi.length < 2) {
+      return null;
+    }
+    // Tail reads index the indicator arrays directly — no per-bar row
+    // objects are built just to compare five scalars.
+    const k = ind.rsi.length - 1;
+    const rsi = ind.rsi[k];
+    // RSI gates first: a mid-range RSI can never fire either rule, so on
+    // most bars the MACD crossover state is never even read.
+    if (rsi >= this.rsiOversold && rsi <= this.rsiOverbought) {
+      return null;
+    }
+    const action = this._classify(rsi, ind.macd[k - 1], ind.signal[k - 1], ind.macd[k], ind.signal[k]);
+    return action ? new SignalEvent(action, this.symbol, this.positionSize) : null;
+  }
+
+  // Malformed views are rejected by explicit precondition checks rather
+  // than a blanket try/catch: a real bug in the kernel below should surface,
+  // not be swallowed into a skipped tick.
+  _addIndicators(view) {
+    const cols = view.columns;
+    const end = view.end;
+    if (!cols || !cols.close || !(end >= 2) || cols.close.length < end) {
+      return null;
+    }
+    const lastTimestamp = cols.timestamp ? cols.timestamp[end - 1] : NaN;
+    let cache = this._cache;
+    if (cache && cache.end === end && cache.lastTimestamp === lastTimestamp) {
+      return cache;
+    }
+    if (!cache || end < cache.end
+      || (cols.timestamp && cols.timestamp[cache.end - 1] !== cache.lastTimestamp)) {
+      // Different or rewritten history: restart the recursions from bar 0.
+      cache = {
+        end: 0,
+        lastTimestamp: NaN,
+        rsi: [],
+        macd: [],
+        signal: [],
+        prevClose: NaN,
+        deltas: 0,
+        avgGain: 0,
+        avgLoss: 0,
+        fastNum: 0,
+        fastDen: 0,
+        slowNum: 0,
+        slowDen: 0,
+        sigNum: 0,
+        sigDen: 0,
+      };
+    }
+    this._extendCache(cache, cols.close, end);
+    cache.lastTimestamp = lastTimestamp;
+    this._cache = cache;
+    return cache;
+  }
+
+  // Advances the Wilder RSI and fused MACD states over bars [cache.end, end)
+  // and appends to the parallel indicator arrays once RSI is out of warmup.
+  // Produces the same values as calculateRsi/calculateMacd over the window.
+  _extendCache(cache, close, end) {
+    const period = this.rsiPeriod;
+    const wilderDecay = (period - 1) / period;
+    const fastDecay = this._fastDecay;
+    const slowDecay = this._slowDecay;
+    const signalDecay = this._signalDecay;
+    for (let i = cache.end; i < end; i += 1) {
+      const v = close[i];
+      let rsi = NaN;
+      if (i > 0) {
+        const delta = v - cache.prevClose;
+        if (cache.deltas < period) {
+          if (delta > 0) {
+            cache.avgGain += delta;
+          } else {
+            cache.avgLoss -= delta;
+          }
+          cache.deltas += 1;
+          if (cache.deltas === period) {
+            cache.avgGain /= period;
+            cache.avgLoss /= period;
+            rsi = cache.avgLoss === 0 ? 100 : 100 - 100 / (1 + cache.avgGain / cache.avgLoss);
+          }
+        } else {
+          const gain = delta > 0 ? delta : 0;
+          const loss = delta < 0 ? -delta : 0;
+          cache.avgGain = cache.avgGain * wilderDecay + gain / period;
+          cache.avgLoss = cache.avgLoss * wilderDecay + loss / period;
+          rsi = cache.avgLoss === 0 ? 100 : 100 - 100 / (1 + cache.avgGain / cache.avgLoss);
+        }
+      }
+      cache.prevClose = v;
+      cache.fastNum = cache.fastNum * fastDecay + v;
+      cache.fastDen = cache.fastDen * fastDecay + 1;
+      cache.slowNum = cache.slowNum * slowDecay + v;
+      cache.slowDen = cache.slowDen * slowDecay + 1;
+      const macd = cache.fastNum / cache.fastDen - cache.slowNum / cache.slowDen;
+      cache.sigNum = cache.sigNum * signalDecay + macd;
+      cache.sigDen = cache.sigDen * signalDecay + 1;
+      const signal = cache.sigNum / cache.sigDen;
+      if (!Number.isNaN(rsi)) {
+        cache.rsi.push(rsi);
+        cache.macd.push(macd);
+        cache.signal.push(signal);
+      }
+    }
+    cache.end = end;
+  }
+}
+
+module.exports = { MomentumStrategy };